@@ -1,25 +1,183 @@
-import requests
+import asyncio
+import aiohttp
+import orjson
 import csv
 import datetime
-from collections import defaultdict
-from typing import Dict, Any, List
+import shelve
+import time
+from collections import Counter, OrderedDict
+from typing import Dict, Any, Iterable, Iterator, Mapping, Optional
+
+GRAPHQL_URL = "https://api.github.com/graphql"
+
+_RETRY_STATUSES = (403, 429, 502)
+_MAX_RETRIES = 6
+_RATE_LIMIT_THRESHOLD = 100
+# GitHub asks for at least a minute between retries of a secondary rate-limit 403 that
+# carries neither Retry-After nor an exhausted X-RateLimit-Remaining.
+_SECONDARY_RATE_LIMIT_DELAY = 60
+_USER_CACHE_SIZE = 4096
+
+# One aliased contributionsCollection per year, spliced into _ALL_YEARS_QUERY along with
+# _YEAR_FRAGMENT. GraphQL rejects unused fragments, so the fragment is only appended when
+# at least one year is requested.
+_YEAR_FIELD = """
+    y{year}: contributionsCollection(from: "{year}-01-01T00:00:00Z", to: "{year}-12-31T23:59:59Z") {{
+      ...YearContributions
+    }}"""
+
+_ALL_YEARS_QUERY = """
+query($user: String!) {
+  user(login: $user) {%s
+    createdAt
+    repositories(first: 100) {
+      totalCount
+      nodes {
+        primaryLanguage {
+          name
+        }
+      }
+    }
+  }
+}
+"""
+
+_YEAR_FRAGMENT = """
+fragment YearContributions on ContributionsCollection {
+  contributionCalendar {
+    totalContributions
+    weeks {
+      contributionDays {
+        date
+        contributionCount
+      }
+    }
+  }
+  totalCommitContributions
+  totalPullRequestContributions
+  totalIssueContributions
+  totalPullRequestReviewContributions
+}
+"""
+
+class DiskCache:
+    def __init__(self, filename: str = "gh_years.db", ttl: float = 3600):
+        """
+        Initializes an on-disk cache backed by shelve. Entries are stored as
+        (timestamp, payload) tuples; a timestamp of None marks an entry that never expires.
+
+        Args:
+            filename (str): Name of the shelve database file.
+            ttl (float): Lifetime, in seconds, of entries stored with an expiry.
+        """
+        self.ttl = ttl
+        self._shelf = shelve.open(filename)
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Retrieves a cached payload.
+
+        Args:
+            key (str): The cache key.
+
+        Returns:
+            Optional[Any]: The cached payload, or None if missing or expired.
+        """
+        entry = self._shelf.get(key)
+        if entry is None:
+            return None
+        timestamp, payload = entry
+        if timestamp is not None and time.time() - timestamp > self.ttl:
+            return None
+        return payload
+
+    def set(self, key: str, payload: Any, expires: bool = False):
+        """
+        Stores a payload in the cache.
+
+        Args:
+            key (str): The cache key.
+            payload (Any): The value to store; must be picklable.
+            expires (bool): Whether the entry expires after the TTL or is kept forever.
+        """
+        self._shelf[key] = (time.time() if expires else None, payload)
+
+    def close(self):
+        """
+        Flushes and closes the underlying shelve database.
+        """
+        self._shelf.close()
 
 class GitHubUserData:
-    def __init__(self, token: str):
+    def __init__(self, token: str, cache: Optional[DiskCache] = None):
         """
         Initializes the class with the GitHub authentication token.
 
         Args:
             token (str): The GitHub authentication token.
+            cache (Optional[DiskCache]): Cache for per-year contribution data. Years before the
+                                         current one are closed and cached forever; the current
+                                         year is cached for the cache's TTL.
         """
         self.headers = {
             "Authorization": f"Bearer {token}",
-            "Content-Type": "application/json"
+            "Content-Type": "application/json",
+            "Accept-Encoding": "gzip"
         }
+        self.cache = cache
+        self._session = None
+        self._user_cache = OrderedDict()
+        self._request_interval = 0.0
+        self._next_request_at = 0.0
+        self._rate_limit_reset = 0
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Returns the HTTP session shared by every request, creating it on first use so that
+        connections to the GitHub API are reused across users.
 
-    def get_user_data(self, user: str) -> Dict[str, Any]:
+        Returns:
+            aiohttp.ClientSession: The shared HTTP session.
+        """
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                headers=self.headers,
+                connector=aiohttp.TCPConnector(limit=20)
+            )
+        return self._session
+
+    async def close(self):
+        """
+        Closes the shared HTTP session.
+        """
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+
+    async def get_user_data(self, user: str) -> Dict[str, Any]:
         """
         Retrieves GitHub user data, including contributions, repositories, and primary language.
+        Results for the _USER_CACHE_SIZE most recently requested usernames are memoized, and
+        concurrent requests for the same user share a single fetch.
+
+        Args:
+            user (str): The GitHub username.
+
+        Returns:
+            Dict[str, Any]: A dictionary containing contribution data, repositories, primary language, 
+                            monthly contributions, and types of contributions.
+        """
+        task = self._user_cache.get(user)
+        if task is None:
+            task = self._user_cache[user] = asyncio.ensure_future(self._fetch_user_data(user))
+            if len(self._user_cache) > _USER_CACHE_SIZE:
+                self._user_cache.popitem(last=False)
+        else:
+            self._user_cache.move_to_end(user)
+        return await task
+
+    async def _fetch_user_data(self, user: str) -> Dict[str, Any]:
+        """
+        Fetches GitHub user data from the API, reusing cached years when available.
 
         Args:
             user (str): The GitHub username.
@@ -29,23 +187,51 @@ class GitHubUserData:
                             monthly contributions, and types of contributions.
         """
         total_contributions = 0
-        monthly_contributions = defaultdict(int)
-        contribution_types = defaultdict(int)
-        start_year = 2017
-        current_year = datetime.datetime.now().year
-
-        for year in range(start_year, current_year + 1):
-            from_date = f"{year}-01-01T00:00:00Z"
-            to_date = f"{year}-12-31T23:59:59Z"
-            user_data_for_year = self._get_user_data_for_year(user, from_date, to_date)
-            
+        monthly_contributions = Counter()
+        contribution_types = Counter()
+        # Only years from the account's creation onward are counted. The creation year comes
+        # back with the batched query, so only runs after the first one can skip requesting
+        # the earlier years.
+        created_year = self.cache.get(f"{user}:createdAt") if self.cache is not None else None
+
+        start_year = max(2017, created_year or 2017)
+        current_year = datetime.datetime.now(datetime.timezone.utc).year  # query bounds are UTC
+        years = range(start_year, current_year + 1)
+
+        yearly_user_data = {}
+        if self.cache is not None:
+            for year in years:
+                cached = self.cache.get(f"{user}:{year}")
+                if cached is not None:
+                    yearly_user_data[year] = cached
+        missing_years = [year for year in years if year not in yearly_user_data]
+
+        user_data = await self._get_all_years(user, missing_years)
+        if not user_data:
+            return self._empty_user_data()
+
+        if created_year is None:
+            created_year = int(user_data["createdAt"][:4])
+            if self.cache is not None:
+                self.cache.set(f"{user}:createdAt", created_year)
+            years = range(max(start_year, created_year), current_year + 1)
+
+        for year in missing_years:
+            if year not in years:
+                continue
+            year_data = user_data.get(f"y{year}")
+            yearly_user_data[year] = self._parse_user_data({"contributionsCollection": year_data or {}})
+            if self.cache is not None and year_data is not None:
+                self.cache.set(f"{user}:{year}", yearly_user_data[year], expires=year == current_year)
+
+        for year in years:
+            user_data_for_year = yearly_user_data[year]
+
             total_contributions += user_data_for_year["contributions"]
-            for month, count in user_data_for_year["monthly_contributions"].items():
-                monthly_contributions[month] += count
-            for key, count in user_data_for_year["contribution_types"].items():
-                contribution_types[key] += count
+            monthly_contributions.update(user_data_for_year["monthly_contributions"])
+            contribution_types.update(user_data_for_year["contribution_types"])
 
-        additional_user_data = self._get_additional_user_data(user)
+        additional_user_data = self._parse_additional_user_data(user_data)
 
         return {
             "contributions": total_contributions,
@@ -55,189 +241,220 @@ class GitHubUserData:
             "contribution_types": dict(contribution_types)
         }
     
-    def _get_user_data_for_year(self, user: str, from_date: str, to_date: str) -> Dict[str, Any]:
+    async def _get_all_years(self, user: str, years: Iterable[int]) -> Dict[str, Any]:
         """
-        Fetches GitHub user data for a specific year.
+        Fetches GitHub user data for several years in a single GraphQL request. Each year is
+        requested as an aliased contributionsCollection field (y2017, y2018, ...) and the
+        account creation date and repositories block are included in the same operation.
 
         Args:
             user (str): GitHub username.
-            from_date (str): The start date (in ISO format) of the year to retrieve data from.
-            to_date (str): The end date (in ISO format) of the year to retrieve data from.
+            years (Iterable[int]): The years to retrieve contribution data for.
 
         Returns:
-            Dict[str, Any]: Parsed user contribution data for the specified year.
-        """
-        query = """
-        query($user: String!, $from: DateTime!, $to: DateTime!) {
-          user(login: $user) {
-            contributionsCollection(from: $from, to: $to) {
-              contributionCalendar {
-                totalContributions
-                weeks {
-                  contributionDays {
-                    date
-                    contributionCount
-                  }
-                }
-              }
-              commitContributionsByRepository {
-                contributions(first: 100) {
-                  totalCount
-                }
-              }
-              pullRequestContributionsByRepository {
-                contributions(first: 100) {
-                  totalCount
-                }
-              }
-              issueContributionsByRepository {
-                contributions(first: 100) {
-                  totalCount
-                }
-              }
-              pullRequestReviewContributionsByRepository {
-                contributions(first: 100) {
-                  totalCount
-                }
-              }
-            }
-          }
-        }
+            Dict[str, Any]: Raw user data keyed by year alias, plus createdAt and the
+                            repositories block.
+                            Empty if the request failed or the user was not found.
+        """
+        year_fields = "".join(_YEAR_FIELD.format(year=year) for year in years)
+        query = _ALL_YEARS_QUERY % year_fields
+        if year_fields:
+            query += _YEAR_FRAGMENT
+        return await self._post_query(user, query)
+
+    async def _post_query(self, user: str, query: str) -> Dict[str, Any]:
+        """
+        Sends a GraphQL query for a user and returns the user object from the response.
+
+        Args:
+            user (str): GitHub username, passed as the $user variable.
+            query (str): The GraphQL query.
+
+        Returns:
+            Dict[str, Any]: The user object, or an empty dictionary if the request failed
+                            or the user was not found.
         """
-        
         variables = {
-            "user": user,
-            "from": from_date,
-            "to": to_date
+            "user": user
         }
-        
-        url = "https://api.github.com/graphql"
-        response = requests.post(url, json={'query': query, 'variables': variables}, headers=self.headers)
-        
-        if response.status_code == 200:
-            data = response.json()
-            if "errors" in data:
-                print(f"Error fetching data for user {user}: {data['errors']}")
-                return self._empty_user_data()
-            
-            user_data = data.get("data", {}).get("user", {})
-            if not user_data:
-                print(f"User not found or no data available: {user}")
-                return self._empty_user_data()
-            
-            return self._parse_user_data(user_data)
-        else:
-            print(f"Error fetching data for user {user}: {response.status_code} {response.text}")
-            return self._empty_user_data()
-    
-    def _get_additional_user_data(self, user: str) -> Dict[str, Any]:
+
+        data = await self._post_with_backoff(user, {'query': query, 'variables': variables})
+        if data is None:
+            return {}
+
+        if "errors" in data:
+            print(f"Error fetching data for user {user}: {data['errors']}")
+            return {}
+
+        user_data = data.get("data", {}).get("user", {})
+        if not user_data:
+            print(f"User not found or no data available: {user}")
+            return {}
+
+        return user_data
+
+    async def _post_with_backoff(self, user: str, payload: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """
-        Retrieves additional information about the user, such as the number of repositories
-        and the primary programming language.
+        Posts a GraphQL payload, retrying rate-limited responses (including a 200 whose
+        errors come with an exhausted X-RateLimit-Remaining), transient failures and timeouts
+        with exponential backoff (1, 2, 4, 8, 16 and 32 seconds). Retry-After and X-RateLimit-Reset are honored
+        when GitHub sends them, and secondary rate-limit 403s without either wait at least
+        _SECONDARY_RATE_LIMIT_DELAY seconds.
 
         Args:
-            user (str): GitHub username.
+            user (str): GitHub username, used in log messages.
+            payload (Dict[str, Any]): The JSON body with the query and variables.
 
         Returns:
-            Dict[str, Any]: Additional user information, such as repositories and primary language.
+            Optional[Dict[str, Any]]: The decoded response, or None if the request failed.
         """
-        query = """
-        query($user: String!) {
-          user(login: $user) {
-            repositories(first: 100) {
-              totalCount
-              nodes {
-                primaryLanguage {
-                  name
-                }
-              }
-            }
-          }
-        }
+        for attempt in range(_MAX_RETRIES + 1):
+            await self._wait_for_rate_limit()
+            try:
+                async with self._get_session().post(GRAPHQL_URL, json=payload) as response:
+                    self._update_rate_limit(response.headers)
+                    if response.status == 200:
+                        data = orjson.loads(await response.read())
+                        # An exhausted primary limit is reported as a 200 with RATE_LIMITED errors.
+                        if ("errors" not in data or response.headers.get("X-RateLimit-Remaining") != "0"
+                                or attempt == _MAX_RETRIES):
+                            return data
+                    else:
+                        text = await response.text()
+                        retryable = response.status in _RETRY_STATUSES
+                        if response.status == 403:
+                            # A plain 403 is a permission error; only rate-limit 403s are worth retrying.
+                            retryable = ("Retry-After" in response.headers
+                                         or response.headers.get("X-RateLimit-Remaining") == "0"
+                                         or "rate limit" in text.lower())
+                        if not retryable or attempt == _MAX_RETRIES:
+                            print(f"Error fetching data for user {user}: {response.status} {text}")
+                            return None
+                    delay = self._retry_delay(response.headers, attempt, response.status)
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                if attempt == _MAX_RETRIES:
+                    print(f"Error fetching data for user {user}: {e!r}")
+                    return None
+                delay = 2 ** attempt
+
+            print(f"Retrying request for user {user} in {delay:.0f}s ({attempt + 1}/{_MAX_RETRIES})...")
+            await asyncio.sleep(delay)
+
+    @staticmethod
+    def _retry_delay(headers: Mapping[str, str], attempt: int, status: int) -> float:
         """
+        Computes how long to wait before retrying a failed request.
 
-        variables = {
-            "user": user
-        }
+        Args:
+            headers (Mapping[str, str]): The failed response's headers.
+            attempt (int): Zero-based number of the attempt that failed.
+            status (int): The failed response's status code.
 
-        url = "https://api.github.com/graphql"
-        response = requests.post(url, json={'query': query, 'variables': variables}, headers=self.headers)
-
-        if response.status_code == 200:
-            data = response.json()
-            if "errors" in data:
-                print(f"Error fetching additional data for user {user}: {data['errors']}")
-                return {"repositories": 0, "primary_language": "N/A"}
-            
-            user_data = data.get("data", {}).get("user", {})
-            if not user_data:
-                print(f"User not found or no data available: {user}")
-                return {"repositories": 0, "primary_language": "N/A"}
-
-            repositories = user_data.get("repositories", {}).get("totalCount", 0)
-
-            languages = {}
-            for repo in user_data.get("repositories", {}).get("nodes", []):
-                primary_language = repo.get("primaryLanguage")
-                if primary_language is not None:
-                    language = primary_language.get("name")
-                    if language:
-                        languages[language] = languages.get(language, 0) + 1
-
-            primary_language = max(languages, key=languages.get) if languages else "N/A"
-
-            return {
-                "repositories": repositories,
-                "primary_language": primary_language
-            }
+        Returns:
+            float: Delay in seconds.
+        """
+        retry_after = headers.get("Retry-After")
+        if retry_after is not None and retry_after.isdigit():
+            return float(retry_after)
+        reset = headers.get("X-RateLimit-Reset")
+        if headers.get("X-RateLimit-Remaining") == "0" and reset is not None:
+            return max(0.0, int(reset) - time.time())
+        if status == 403:
+            return max(_SECONDARY_RATE_LIMIT_DELAY, 2 ** attempt)
+        return 2 ** attempt
+
+    def _update_rate_limit(self, headers: Mapping[str, str]):
+        """
+        Adjusts the minimum interval between requests from GitHub's rate-limit headers. Once
+        fewer than _RATE_LIMIT_THRESHOLD points remain, the remaining points are spread evenly
+        until the window resets instead of being spent at full speed. Slots handed out under
+        a previous window are dropped as soon as a response shows a new one.
+
+        Args:
+            headers (Mapping[str, str]): Response headers.
+        """
+        remaining = headers.get("X-RateLimit-Remaining")
+        reset = headers.get("X-RateLimit-Reset")
+        if remaining is None or reset is None:
+            return
+        remaining, reset = int(remaining), int(reset)
+        if reset > self._rate_limit_reset:
+            self._rate_limit_reset = reset
+            self._next_request_at = 0.0
+        if remaining < _RATE_LIMIT_THRESHOLD:
+            self._request_interval = max(0.0, reset - time.time()) / max(remaining, 1)
         else:
-            print(f"Error fetching additional data for user {user}: {response.status_code} {response.text}")
-            return {"repositories": 0, "primary_language": "N/A"}
+            self._request_interval = 0.0
 
+    async def _wait_for_rate_limit(self):
+        """
+        Waits for this request's slot. Slots are handed out _request_interval seconds apart
+        and shared by every concurrent request, so throttling applies across all users.
+        No slot is scheduled past the current window's reset, when the full quota is back.
+        """
+        now = time.time()
+        slot = max(now, min(self._next_request_at, self._rate_limit_reset))
+        self._next_request_at = slot + self._request_interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
 
-    def _parse_user_data(self, user_data: Dict[str, Any]) -> Dict[str, Any]:
+    def _parse_additional_user_data(self, user_data: Dict[str, Any]) -> Dict[str, Any]:
         """
-        Parses the user data obtained from the GitHub API.
+        Parses additional information about the user, such as the number of repositories
+        and the primary programming language.
 
         Args:
             user_data (Dict[str, Any]): Raw GitHub user data.
 
         Returns:
-            Dict[str, Any]: Parsed user data.
+            Dict[str, Any]: Additional user information, such as repositories and primary language.
         """
-        contributions = user_data.get("contributionsCollection", {}).get("contributionCalendar", {}).get("totalContributions", 0)
         repositories = user_data.get("repositories", {}).get("totalCount", 0)
+
+        languages = Counter(
+            repo["primaryLanguage"]["name"]
+            for repo in user_data.get("repositories", {}).get("nodes", [])
+            if repo.get("primaryLanguage") and repo["primaryLanguage"].get("name")
+        )
+        primary_language = languages.most_common(1)[0][0] if languages else "N/A"
+
+        return {
+            "repositories": repositories,
+            "primary_language": primary_language
+        }
+
+
+    def _parse_user_data(self, user_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Parses one year of contribution data obtained from the GitHub API.
+
+        Args:
+            user_data (Dict[str, Any]): Raw GitHub user data holding a contributionsCollection.
+
+        Returns:
+            Dict[str, Any]: Parsed contribution totals, monthly contributions, and contribution types.
+        """
+        contributions_collection = user_data.get("contributionsCollection") or {}
+        calendar = contributions_collection.get("contributionCalendar") or {}
+
+        contributions = calendar.get("totalContributions", 0)
+        weekly_contributions = calendar.get("weeks", [])
         
-        languages = {}
-        for repo in user_data.get("repositories", {}).get("nodes", []):
-            primary_language = repo.get("primaryLanguage")
-            if primary_language is not None:
-                language = primary_language.get("name")
-                if language:
-                    languages[language] = languages.get(language, 0) + 1
-        
-        primary_language = max(languages, key=languages.get) if languages else "N/A"
-        
-        weekly_contributions = user_data.get("contributionsCollection", {}).get("contributionCalendar", {}).get("weeks", [])
-        
-        monthly_contributions = defaultdict(int)
-        for week in weekly_contributions:
-            for day in week.get("contributionDays", []):
-                date = datetime.datetime.strptime(day["date"], "%Y-%m-%d")
-                month = date.strftime("%Y-%m")
-                monthly_contributions[month] += day["contributionCount"]
+        days = (day for week in weekly_contributions for day in week.get("contributionDays", []))
+
+        monthly_contributions = Counter()
+        for day in days:
+            monthly_contributions[day["date"][:7]] += day["contributionCount"]  # dates are "YYYY-MM-DD"
         
         contribution_types = {
-            "commits": sum(repo["contributions"]["totalCount"] for repo in user_data.get("contributionsCollection", {}).get("commitContributionsByRepository", [])),
-            "pull_requests": sum(repo["contributions"]["totalCount"] for repo in user_data.get("contributionsCollection", {}).get("pullRequestContributionsByRepository", [])),
-            "issues": sum(repo["contributions"]["totalCount"] for repo in user_data.get("contributionsCollection", {}).get("issueContributionsByRepository", [])),
-            "reviews": sum(repo["contributions"]["totalCount"] for repo in user_data.get("contributionsCollection", {}).get("pullRequestReviewContributionsByRepository", []))
+            "commits": contributions_collection.get("totalCommitContributions", 0),
+            "pull_requests": contributions_collection.get("totalPullRequestContributions", 0),
+            "issues": contributions_collection.get("totalIssueContributions", 0),
+            "reviews": contributions_collection.get("totalPullRequestReviewContributions", 0)
         }
         
         return {
             "contributions": contributions,
-            "repositories": repositories,
-            "primary_language": primary_language,
             "monthly_contributions": dict(monthly_contributions),
             "contribution_types": contribution_types
         }
@@ -259,6 +476,8 @@ class GitHubUserData:
         }
 
 class CSVProcessor:
+    FIELDNAMES = ["user", "contributions", "repositories", "primary_language", "monthly_contributions", "contribution_types"]
+
     def __init__(self, input_csv: str, output_csv: str):
         """
         Initializes the class with the input and output CSV filenames.
@@ -275,22 +494,24 @@ class CSVProcessor:
         """
         Initializes the output CSV file with the header. 
         This method is called at the beginning to ensure the file exists and has a header.
+        The file is kept open for the rest of the run; call close() when done.
         """
-        with open(self.output_csv, mode='w', newline='') as file:
-            fieldnames = ["user", "contributions", "repositories", "primary_language", "monthly_contributions", "contribution_types"]
-            writer = csv.DictWriter(file, fieldnames=fieldnames)
-            writer.writeheader()
+        self._file = open(self.output_csv, mode='w', newline='', buffering=1 << 16)
+        self._writer = csv.DictWriter(self._file, fieldnames=self.FIELDNAMES)
+        self._writer.writeheader()
 
-    def read_users(self) -> List[str]:
+    def iter_users(self) -> Iterator[str]:
         """
-        Reads the list of GitHub users from the input CSV file.
+        Lazily reads GitHub users from the input CSV file, one row at a time.
+        Blank rows are skipped.
 
-        Returns:
-            List[str]: List of GitHub usernames.
+        Yields:
+            str: A GitHub username.
         """
         with open(self.input_csv, mode='r', newline='') as file:
-            reader = csv.reader(file)
-            return [row[0] for row in reader]
+            for row in csv.reader(file):
+                if row:
+                    yield row[0]
 
     def write_user_data(self, result: Dict[str, Any]):
         """
@@ -299,18 +520,22 @@ class CSVProcessor:
         Args:
             result (Dict[str, Any]): Dictionary containing the user's data.
         """
-        with open(self.output_csv, mode='a', newline='') as file:  # Use 'a' to append data
-            fieldnames = ["user", "contributions", "repositories", "primary_language", "monthly_contributions", "contribution_types"]
-            writer = csv.DictWriter(file, fieldnames=fieldnames)
-            result["monthly_contributions"] = str(result["monthly_contributions"])
-            result["contribution_types"] = str(result["contribution_types"])
-            writer.writerow(result)
+        result["monthly_contributions"] = str(result["monthly_contributions"])
+        result["contribution_types"] = str(result["contribution_types"])
+        self._writer.writerow(result)
 
         print(f"User data for {result['user']} saved to {self.output_csv}.")
 
+    def close(self):
+        """
+        Flushes and closes the output CSV file.
+        """
+        self._file.close()
+
 
 class GitHubContributorSummary:
-    def __init__(self, token: str, input_csv: str, output_csv: str):
+    def __init__(self, token: str, input_csv: str, output_csv: str, max_concurrency: int = 10,
+                 cache_file: str = "gh_years.db"):
         """
         Initializes the class with the GitHub authentication token, input, and output CSV filenames.
 
@@ -318,30 +543,62 @@ class GitHubContributorSummary:
             token (str): GitHub authentication token.
             input_csv (str): Name of the input CSV file.
             output_csv (str): Name of the output CSV file.
+            max_concurrency (int): Maximum number of users fetched at the same time. Kept low
+                                   to stay under GitHub's secondary rate limits.
+            cache_file (str): Name of the on-disk cache of per-year contribution data.
         """
-        self.github_user_data = GitHubUserData(token)
+        self.cache = DiskCache(cache_file)
+        self.github_user_data = GitHubUserData(token, self.cache)
         self.csv_processor = CSVProcessor(input_csv, output_csv)
+        self.max_concurrency = max_concurrency
 
     def generate_summary(self):
         """
         Generates a summary of GitHub contributors' data and writes it to the output CSV file
         immediately after processing each user's data.
         """
-        users = self.csv_processor.read_users()
-        for user in users:
-            try:
-                user_data = self.github_user_data.get_user_data(user)
-                result = {
-                    "user": user,
-                    "contributions": user_data["contributions"],
-                    "repositories": user_data["repositories"],
-                    "primary_language": user_data["primary_language"],
-                    "monthly_contributions": user_data["monthly_contributions"],
-                    "contribution_types": user_data["contribution_types"]
-                }
-                self.csv_processor.write_user_data(result)
-            except Exception as e:
-                print(f"Error processing user {user}: {e}")
+        asyncio.run(self._generate_summary())
+
+    async def _generate_summary(self):
+        """
+        Processes users concurrently on a single event loop. max_concurrency workers pull
+        users from the input CSV as they go, so the file is streamed rather than loaded up
+        front. Rows are written as each user completes, so the output order may differ
+        from the input order.
+        """
+        users = self.csv_processor.iter_users()
+
+        async def worker():
+            for user in users:
+                await self._process_user(user)
+
+        try:
+            await asyncio.gather(*(worker() for _ in range(self.max_concurrency)))
+        finally:
+            await self.github_user_data.close()
+            self.cache.close()
+            self.csv_processor.close()
+
+    async def _process_user(self, user: str):
+        """
+        Fetches a single user's data and writes it to the output CSV file.
+
+        Args:
+            user (str): The GitHub username.
+        """
+        try:
+            user_data = await self.github_user_data.get_user_data(user)
+            result = {
+                "user": user,
+                "contributions": user_data["contributions"],
+                "repositories": user_data["repositories"],
+                "primary_language": user_data["primary_language"],
+                "monthly_contributions": user_data["monthly_contributions"],
+                "contribution_types": user_data["contribution_types"]
+            }
+            self.csv_processor.write_user_data(result)
+        except Exception as e:
+            print(f"Error processing user {user}: {e}")
 
 if __name__ == '__main__':
     token = 'token'
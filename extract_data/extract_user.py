@@ -1,10 +1,96 @@
-import requests
+import asyncio
+import aiohttp
+import orjson
 import csv
+import logging
+import random
+import shelve
+import sys
 import time
-from typing import List, Set, Dict, Any, Optional
+from typing import List, Set, Dict, Any, Iterable, Mapping, Optional
+
+try:
+    import brotli  # noqa: F401 -- lets aiohttp decode brotli-compressed responses
+    _ACCEPT_ENCODING = 'gzip, deflate, br'
+except ImportError:
+    _ACCEPT_ENCODING = 'gzip, deflate'
+
+log = logging.getLogger(__name__)
+
+GRAPHQL_URL = 'https://api.github.com/graphql'
+
+_RETRY_STATUSES = (403, 429, 500, 502, 503, 504)
+_MAX_RETRIES = 5
+_BACKOFF_FACTOR = 1.5
+_RATE_LIMIT_THRESHOLD = 50
+# GitHub asks for at least a minute between retries of a secondary rate-limit 403 that
+# carries neither Retry-After nor an exhausted X-RateLimit-Remaining.
+_SECONDARY_RATE_LIMIT_DELAY = 60
+
+_HISTORY_PAGE_FRAGMENT = '''
+fragment HistoryPage on CommitHistoryConnection {
+  pageInfo {
+    hasNextPage
+    endCursor
+  }
+  nodes {
+    author {
+      user {
+        login
+      }
+    }
+  }
+}
+'''
+
+# Source (non-fork) repositories of the organization, each with the first page of its
+# default branch history.
+_ORGANIZATION_QUERY = '''
+query($organization: String!, $since: GitTimestamp!, $until: GitTimestamp!, $cursor: String) {
+  organization(login: $organization) {
+    repositories(first: 100, after: $cursor, isFork: false) {
+      pageInfo {
+        hasNextPage
+        endCursor
+      }
+      nodes {
+        name
+        defaultBranchRef {
+          target {
+            oid
+            ... on Commit {
+              history(since: $since, until: $until, first: 100) {
+                ...HistoryPage
+              }
+            }
+          }
+        }
+      }
+    }
+  }
+}
+''' + _HISTORY_PAGE_FRAGMENT
+
+# Further pages of a single repository's default branch history.
+_HISTORY_QUERY = '''
+query($organization: String!, $repo: String!, $since: GitTimestamp!, $until: GitTimestamp!, $cursor: String) {
+  repository(owner: $organization, name: $repo) {
+    defaultBranchRef {
+      target {
+        ... on Commit {
+          history(since: $since, until: $until, first: 100, after: $cursor) {
+            ...HistoryPage
+          }
+        }
+      }
+    }
+  }
+}
+''' + _HISTORY_PAGE_FRAGMENT
 
 class GitHubContributors:
-    def __init__(self, token: str, organization: str, start_date: str, end_date: str, output_csv: str):
+    def __init__(self, token: str, organization: str, start_date: str, end_date: str, output_csv: str,
+                 max_concurrency: int = 8, cache_file: str = 'gh_cache.db'):
         """
         Initializes the class with GitHub authentication credentials and other parameters.
 
@@ -14,114 +100,305 @@ class GitHubContributors:
             start_date (str): Start date in ISO 8601 format.
             end_date (str): End date in ISO 8601 format.
             output_csv (str): The name of the output CSV file.
+            max_concurrency (int): Maximum number of repositories whose history is paginated at
+                                   the same time. Kept low to stay under GitHub's secondary rate limits.
+            cache_file (str): Name of the on-disk cache of contributors per repository.
         """
         self.headers = {
             'Authorization': f'token {token}',
-            'Accept': 'application/vnd.github.v3+json',
+            'Accept-Encoding': _ACCEPT_ENCODING,
         }
         self.organization = organization
         self.start_date = start_date
         self.end_date = end_date
         self.output_csv = output_csv
+        self.max_concurrency = max_concurrency
+        self.cache_file = cache_file
+        self._cache = None
+        self._session = None
+        self._csvfile = None
+        self._writer = None
+        self._written = set()
+        self._resume_at = 0.0
+        # The organization and date range are fixed for the run, so the query variables and
+        # cache key suffix they produce are built once here.
+        self._variables = {
+            'organization': organization,
+            'since': start_date,
+            'until': end_date,
+        }
+        self._cache_key_suffix = f':{start_date}:{end_date}'
+
+    async def _post_graphql(self, query: str, variables: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Sends a GraphQL query, retrying rate-limited and server errors (including a 200 whose
+        errors come with an exhausted X-RateLimit-Remaining), dropped connections and timeouts
+        with jittered exponential backoff. Other client errors fail immediately.
+        Retry-After is honored, secondary rate-limit 403s without it wait at least
+        _SECONDARY_RATE_LIMIT_DELAY seconds, and every response's rate-limit headers feed the
+        shared pause applied by _wait_for_rate_limit.
+
+        Args:
+            query (str): The GraphQL query.
+            variables (Dict[str, Any]): The query variables.
+
+        Returns:
+            Dict[str, Any]: The response's data object.
+
+        Raises:
+            aiohttp.ClientError: If the request keeps failing.
+            asyncio.TimeoutError: If the request keeps timing out.
+            RuntimeError: If the response contains GraphQL errors.
+        """
+        for attempt in range(_MAX_RETRIES + 1):
+            await self._wait_for_rate_limit()
+            try:
+                async with self._session.post(GRAPHQL_URL, json={'query': query, 'variables': variables}) as response:
+                    self._update_rate_limit(response.headers)
+                    retryable = response.status in _RETRY_STATUSES
+                    secondary_limit = False
+                    if response.ok:
+                        data = orjson.loads(await response.read())
+                        # An exhausted primary limit is reported as a 200 with RATE_LIMITED errors;
+                        # _update_rate_limit has already paused requests until the reset.
+                        retryable = 'errors' in data and response.headers.get('X-RateLimit-Remaining') == '0'
+                    elif response.status == 403 and 'Retry-After' not in response.headers \
+                            and response.headers.get('X-RateLimit-Remaining') != '0':
+                        # A plain 403 is a permission error; a secondary rate limit without either
+                        # header only says so in the response body.
+                        secondary_limit = 'rate limit' in (await response.text()).lower()
+                        retryable = secondary_limit
+                    if not retryable or attempt == _MAX_RETRIES:
+                        response.raise_for_status()
+                        break
+                    retry_after = response.headers.get('Retry-After')
+                    if retry_after and retry_after.isdigit():
+                        delay = float(retry_after)
+                    elif secondary_limit:
+                        delay = _SECONDARY_RATE_LIMIT_DELAY + self._backoff_delay(attempt)
+                    else:
+                        delay = self._backoff_delay(attempt)
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                if attempt == _MAX_RETRIES:
+                    raise
+                delay = self._backoff_delay(attempt)
+            await asyncio.sleep(delay)
+
+        if 'errors' in data:
+            raise RuntimeError(data['errors'])
+        return data['data']
+
+    @staticmethod
+    def _backoff_delay(attempt: int) -> float:
+        """
+        Computes an exponential backoff delay with full jitter, so concurrent tasks that failed
+        together do not retry in lockstep.
+
+        Args:
+            attempt (int): Zero-based number of the attempt that failed.
+
+        Returns:
+            float: Delay in seconds.
+        """
+        return random.uniform(0, _BACKOFF_FACTOR * 2 ** attempt)
+
+    def _update_rate_limit(self, headers: Mapping[str, str]):
+        """
+        Reads X-RateLimit-Remaining and X-RateLimit-Reset from a response. When fewer than
+        _RATE_LIMIT_THRESHOLD points remain, every request is paused until the window resets.
+
+        Args:
+            headers (Mapping[str, str]): Response headers.
+        """
+        remaining = headers.get('X-RateLimit-Remaining')
+        reset = headers.get('X-RateLimit-Reset')
+        if remaining is None or reset is None or int(remaining) >= _RATE_LIMIT_THRESHOLD:
+            return
+        if int(reset) > self._resume_at:
+            self._resume_at = int(reset)
+            log.warning('Rate limit almost exhausted, waiting %.0fs for it to reset...', max(0.0, self._resume_at - time.time()))
 
-    def get_repositories(self) -> List[str]:
+    async def _wait_for_rate_limit(self):
         """
-        Retrieves the list of repositories from the organization.
+        Waits until the rate-limit window resets if requests are currently paused.
+        """
+        delay = self._resume_at - time.time()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    @staticmethod
+    def _get_history(repository: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Extracts the default branch history from a repository node.
+
+        Args:
+            repository (Dict[str, Any]): A repository node from a GraphQL response.
 
         Returns:
-            List[str]: A list of repository names.
+            Optional[Dict[str, Any]]: The history connection, or None for empty repositories.
         """
-        repos = []
-        url = f'https://api.github.com/orgs/{self.organization}/repos'
-        while url:
-            response = requests.get(url, headers=self.headers)
-            response.raise_for_status()
-            repos.extend(response.json())
-            url = response.links.get('next', {}).get('url')
-        return [repo['name'] for repo in repos]
+        branch = repository.get('defaultBranchRef')
+        if not branch or not branch.get('target'):
+            return None
+        return branch['target'].get('history')
 
-    def get_commits(self, repo: str) -> List[Dict[str, Any]]:
+    async def get_contributors_for_repo(self, semaphore: asyncio.Semaphore, repo: str, oid: str,
+                                        contributors: Set[str], cursor: Optional[str]) -> Set[str]:
         """
-        Retrieves the list of commits from a specific repository.
+        Completes a repository's contributors by paginating the rest of its history, then
+        caches them against the default branch tip. Repositories whose history could not be
+        read in full are not cached.
 
         Args:
+            semaphore (asyncio.Semaphore): Bounds how many repositories are paginated at once.
             repo (str): The repository name.
+            oid (str): The default branch tip the history was read from.
+            contributors (Set[str]): Contributors already found in the first page of history.
+            cursor (Optional[str]): The cursor after which the history continues, if it does.
 
         Returns:
-            List[Dict[str, Any]]: A list of commits.
-        """
-        commits = []
-        url = f'https://api.github.com/repos/{self.organization}/{repo}/commits'
-        params = {
-            'since': self.start_date,
-            'until': self.end_date,
-            'per_page': 100,
-        }
-        while url:
-            attempts = 0
-            success = False
-            while attempts < 2 and not success:
+            Set[str]: A set of contributor usernames.
+        """
+        variables = {**self._variables, 'repo': repo}
+        async with semaphore:
+            while cursor:
+                variables['cursor'] = cursor
                 try:
-                    response = requests.get(url, headers=self.headers, params=params)
-                    response.raise_for_status()
-                    commits.extend(response.json())
-                    url = response.links.get('next', {}).get('url')
-                    success = True
-                except requests.exceptions.RequestException as e:
-                    attempts += 1
-                    print(f"Error fetching commits from repository {repo}: {e}")
-                    print(f"Retrying ({attempts}/2)...")
-                    time.sleep(5)
-                    if attempts == 2:
-                        print("Max retries reached. Skipping to the next repository.")
-                        url = None
-        return commits
+                    data = await self._post_graphql(_HISTORY_QUERY, variables)
+                except (aiohttp.ClientError, asyncio.TimeoutError, RuntimeError) as e:
+                    log.warning('Error fetching commits from repository %s: %s. Skipping to the next repository.', repo, e)
+                    return contributors
+                history = self._get_history(data['repository'] or {})
+                if history is None:
+                    # Renamed, deleted or emptied mid-run: keep what was found, but do not cache
+                    # a partial set against a tip that may stay unchanged.
+                    log.warning('History of repository %s is no longer available. Skipping to the next repository.', repo)
+                    return contributors
+                page_contributors = self.get_contributors(history['nodes'])
+                self.save_to_csv(page_contributors)
+                contributors.update(page_contributors)
+                page_info = history['pageInfo']
+                cursor = page_info['endCursor'] if page_info['hasNextPage'] else None
+
+        self._csvfile.flush()
+        self._cache[self._cache_key(repo)] = (oid, frozenset(contributors))
+        return contributors
+
+    def _cache_key(self, repo: str) -> str:
+        """
+        Builds the cache key of a repository for the configured date range.
+
+        Args:
+            repo (str): The repository name.
+
+        Returns:
+            str: The cache key.
+        """
+        return repo + self._cache_key_suffix
+
+    async def get_all_contributors(self) -> Set[str]:
+        """
+        Retrieves the contributors of every repository in the organization. Repositories are
+        listed a hundred at a time together with the first page of their history, which is
+        reduced to logins right away so the raw page can be released. Repositories with more
+        history are then paginated concurrently. Repositories whose default branch tip matches
+        the cache reuse the cached contributors instead. Contributors are written to the CSV
+        as they are found.
+
+        Returns:
+            Set[str]: A set of contributor usernames.
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        tasks = []
+        variables = {**self._variables, 'cursor': None}
+        while True:
+            data = await self._post_graphql(_ORGANIZATION_QUERY, variables)
+            repositories = data['organization']['repositories']
+            for repository in repositories['nodes']:
+                repo = repository['name']
+                log.info('Processing repository: %s', repo)
+                history = self._get_history(repository)
+                if history is None:
+                    continue
+
+                oid = repository['defaultBranchRef']['target']['oid']
+                cached = self._cache.get(self._cache_key(repo))
+                if cached is not None and cached[0] == oid:
+                    self.save_to_csv(cached[1])
+                    continue
+
+                contributors = self.get_contributors(history['nodes'])
+                self.save_to_csv(contributors)
+                page_info = history['pageInfo']
+                tasks.append(asyncio.ensure_future(self.get_contributors_for_repo(
+                    semaphore, repo, oid, contributors,
+                    page_info['endCursor'] if page_info['hasNextPage'] else None
+                )))
+            self._csvfile.flush()
+            if not repositories['pageInfo']['hasNextPage']:
+                break
+            variables['cursor'] = repositories['pageInfo']['endCursor']
+
+        await asyncio.gather(*tasks)
+        return self._written
 
     @staticmethod
     def get_contributors(commits: List[Dict[str, Any]]) -> Set[str]:
         """
-        Retrieves the list of contributors from the commit list.
+        Retrieves the list of contributors from the commit list. Logins are interned so the
+        same contributor seen across pages and repositories shares a single string.
 
         Args:
-            commits (List[Dict[str, Any]]): A list of commits.
+            commits (List[Dict[str, Any]]): A list of commit nodes.
 
         Returns:
             Set[str]: A set of contributor usernames.
         """
         contributors = set()
         for commit in commits:
-            if commit['author']:  
-                contributors.add(commit['author']['login'])
+            user = (commit.get('author') or {}).get('user')
+            if user:
+                contributors.add(sys.intern(user['login']))
         return contributors
 
-    def save_to_csv(self, contributors: Set[str]):
+    def save_to_csv(self, contributors: Iterable[str]):
         """
-        Saves the list of contributors to a CSV file.
+        Appends the contributors that have not been written yet to the output CSV file.
 
         Args:
-            contributors (Set[str]): A set of contributor usernames.
+            contributors (Iterable[str]): Contributor usernames.
         """
-        with open(self.output_csv, 'w', newline='') as csvfile:
-            writer = csv.writer(csvfile)
-            writer.writerow(['User'])
-            for contributor in contributors:
-                writer.writerow([contributor])
-        print(f'Successfully written to {self.output_csv}')
+        new_contributors = [contributor for contributor in contributors if contributor not in self._written]
+        self._written.update(new_contributors)
+        self._writer.writerows((contributor,) for contributor in new_contributors)
 
     def run(self):
         """
         Runs the complete process of retrieving contributors and saving them to a CSV.
         """
-        all_contributors = set()
-        repositories = self.get_repositories()
-        for repo in repositories:
-            print(f'Processing repository: {repo}')
-            commits = self.get_commits(repo)
-            contributors = self.get_contributors(commits)
-            all_contributors.update(contributors)
-        self.save_to_csv(all_contributors)
+        asyncio.run(self.run_async())
+
+    async def run_async(self):
+        """
+        Retrieves the contributors of every repository and saves them to a CSV. The file is
+        written incrementally, so contributors found before a failure are kept.
+        """
+        connector = aiohttp.TCPConnector(limit=16, ttl_dns_cache=300)
+        with open(self.output_csv, 'w', newline='', buffering=1 << 20) as csvfile, \
+                shelve.open(self.cache_file) as cache:
+            self._csvfile = csvfile
+            self._writer = csv.writer(csvfile)
+            self._writer.writerow(['User'])
+            self._written = set()
+            async with aiohttp.ClientSession(headers=self.headers, connector=connector) as session:
+                self._cache = cache
+                self._session = session
+                await self.get_all_contributors()
+        log.info('Successfully written to %s', self.output_csv)
 
 if __name__ == '__main__':
+    logging.basicConfig(level=logging.WARNING, format='%(levelname)s: %(message)s')
+
     token = 'token'
     organization = 'organization'
     start_date = '2017-01-01T00:00:00Z'